@@ -7,8 +7,10 @@ labeling by using Claude to understand publication context.
 
 import json
 import os
+from concurrent.futures import ThreadPoolExecutor
 from typing import Optional
 
+from .config import Config
 from .logger import get_logger, ProgressBar
 
 logger = get_logger(__name__)
@@ -187,11 +189,15 @@ def categorize_with_claude(
 
     progress = ProgressBar(len(batches), "AI Labeling")
 
-    for batch_num, batch in enumerate(batches, 1):
-        logger.debug(f"Processing batch {batch_num}/{len(batches)} ({len(batch)} pubs)")
-        batch_results = _categorize_batch(client, batch, model)
-        all_categories.update(batch_results)
-        progress.update(1, f"Batch {batch_num}/{len(batches)}")
+    # Each batch is an independent API round-trip, so send them concurrently;
+    # map() yields results in batch order, keeping the merge deterministic
+    max_workers = min(Config.max_workers, len(batches))
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        results = executor.map(lambda batch: _categorize_batch(client, batch, model), batches)
+        for batch_num, (batch, batch_results) in enumerate(zip(batches, results), 1):
+            logger.debug(f"Processed batch {batch_num}/{len(batches)} ({len(batch)} pubs)")
+            all_categories.update(batch_results)
+            progress.update(1, f"Batch {batch_num}/{len(batches)}")
 
     # Apply categories back to publications
     labeled_count = 0
@@ -1,22 +1,183 @@
 """
 Cache management module for content analysis results.
+
+Entries live in a single SQLite database (cache.db) inside the cache
+directory, one row per URL keyed by a hash of the URL.
 """
 
 import os
+import atexit
+import glob
 import hashlib
+import json
 import pickle
-from datetime import datetime, timedelta
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from functools import lru_cache
 from .config import Config, CACHE_EXPIRY_DAYS
 from .logger import get_logger
 
+# orjson and msgpack are optional: both encode the plain dict payloads we
+# store faster than pickle, which keeps the cache working without them
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+
 logger = get_logger(__name__)
 
+CACHE_DB_FILENAME = "cache.db"
+
+# Open database connections: cache_dir -> sqlite3.Connection
+_connections = {}
+
+# In-memory cache index populated by preload_cache(): cache_dir -> {key: (ts, metadata)}
+_memory_cache = {}
 
+# Deferred writes: (cache_dir, key) -> (url, ts, metadata), flushed in batches
+FLUSH_INTERVAL_SECONDS = 5
+_pending_writes = {}
+_flush_timer = None
+
+# Guards the shared connections and the pending-write buffer across threads
+_lock = threading.RLock()
+
+
+@lru_cache(maxsize=4096)
 def get_cache_key(url):
-    """Generate a cache key from a URL"""
+    """
+    Generate a cache key from a URL
+
+    Always MD5, whatever accelerators are installed, so the same URL maps
+    to the same entry in every environment.
+    """
     return hashlib.md5(url.encode()).hexdigest()
 
 
+def _dumps(metadata):
+    """Serialize a metadata dict for storage (orjson, then msgpack, then pickle)"""
+    if orjson:
+        return orjson.dumps(metadata, option=orjson.OPT_NON_STR_KEYS)
+    if msgpack:
+        return msgpack.packb(metadata, use_bin_type=True)
+    return pickle.dumps(metadata, protocol=pickle.HIGHEST_PROTOCOL)
+
+
+def _loads(blob):
+    """
+    Deserialize a stored metadata dict.
+
+    The format is detected from the first byte, and get_cache_key() does
+    not depend on installed packages, so entries written while a different
+    accelerator was installed are still found and decoded.
+    """
+    if blob[:1] == b"{":
+        return orjson.loads(blob) if orjson else json.loads(blob)
+    if blob[:1] == b"\x80" and len(blob) > 1:
+        # Pickle protocol 2+ header (a bare 0x80 is an empty msgpack map)
+        return pickle.loads(blob)
+    return msgpack.unpackb(blob, raw=False)
+
+
+def _now():
+    """Current time as an integer UNIX timestamp"""
+    return int(time.time())
+
+
+def _expiry_cutoff():
+    """Entries with a timestamp at or before this are expired"""
+    # Plain float arithmetic; no datetime/timedelta objects per lookup
+    return time.time() - CACHE_EXPIRY_DAYS * 86400
+
+
+def _get_connection(cache_dir, create=False):
+    """
+    Return the shared connection for cache_dir, opening it on first use.
+
+    Returns None when the database does not exist and create is False,
+    so read-only lookups never create an empty cache. Raises
+    sqlite3.DatabaseError when the file is corrupt or not a database.
+    """
+    with _lock:
+        conn = _connections.get(cache_dir)
+        if conn is not None:
+            return conn
+
+        db_path = os.path.join(cache_dir, CACHE_DB_FILENAME)
+        if create:
+            os.makedirs(cache_dir, exist_ok=True)
+            conn = sqlite3.connect(db_path, check_same_thread=False)
+        else:
+            # Open without creating; a missing database is just a cache miss
+            db_uri = Path(os.path.abspath(db_path)).as_uri() + "?mode=rw"
+            try:
+                conn = sqlite3.connect(db_uri, uri=True, check_same_thread=False)
+            except sqlite3.OperationalError:
+                return None
+        try:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS cache "
+                "(key TEXT PRIMARY KEY, url TEXT, ts INTEGER, blob BLOB)"
+            )
+            # Drop expired entries once per run instead of checking files
+            conn.execute("DELETE FROM cache WHERE ts <= ?", (_expiry_cutoff(),))
+            conn.commit()
+        except sqlite3.DatabaseError:
+            conn.close()
+            raise
+
+        _connections[cache_dir] = conn
+        return conn
+
+
+def preload_cache(cache_dir=None):
+    """
+    Load every unexpired cache entry into memory with a single query.
+
+    Subsequent get_cached_metadata() calls for this cache_dir are served
+    from memory instead of one database round-trip per URL.
+    Returns the number of entries loaded.
+    """
+    if cache_dir is None:
+        cache_dir = Config.cache_dir
+
+    index = {}
+    try:
+        with _lock:
+            conn = _get_connection(cache_dir)
+            rows = (
+                conn.execute(
+                    "SELECT key, ts, blob FROM cache WHERE ts > ?",
+                    (_expiry_cutoff(),),
+                ).fetchall()
+                if conn is not None
+                else []
+            )
+    except Exception as e:
+        logger.debug(f"Error reading cache: {e}")
+        return 0
+
+    for cache_key, ts, blob in rows:
+        try:
+            index[cache_key] = (ts, _loads(blob))
+        except Exception as e:
+            # An entry we cannot decode is just a cache miss
+            logger.debug(f"Skipping unreadable cache entry: {e}")
+
+    _memory_cache[cache_dir] = index
+    logger.debug(f"Preloaded {len(index)} cache entries from {cache_dir}")
+    return len(index)
+
+
 def get_cached_metadata(url, cache_dir=None):
     """
     Retrieve cached metadata for a URL if it exists and is not expired
@@ -25,51 +186,133 @@ def get_cached_metadata(url, cache_dir=None):
     if cache_dir is None:
         cache_dir = Config.cache_dir
 
-    if not os.path.exists(cache_dir):
-        return None
-
     cache_key = get_cache_key(url)
-    cache_file = os.path.join(cache_dir, f"{cache_key}.pkl")
 
-    if not os.path.exists(cache_file):
-        return None
+    # Entries saved but not yet flushed to disk
+    with _lock:
+        pending = _pending_writes.get((cache_dir, cache_key))
+    if pending is not None:
+        return pending[2]
+
+    # Serve from the in-memory index when the directory was preloaded
+    index = _memory_cache.get(cache_dir)
+    if index is not None:
+        cached = index.get(cache_key)
+        if cached is None or cached[0] <= _expiry_cutoff():
+            return None
+        return cached[1]
 
     try:
-        with open(cache_file, "rb") as f:
-            cached_data = pickle.load(f)
-
-        # Check if cache is expired
-        cache_time = cached_data.get("timestamp")
-        if cache_time:
-            age = datetime.now() - cache_time
-            if age > timedelta(days=CACHE_EXPIRY_DAYS):
+        with _lock:
+            conn = _get_connection(cache_dir)
+            if conn is None:
                 return None
+            row = conn.execute(
+                "SELECT blob FROM cache WHERE key = ? AND ts > ?",
+                (cache_key, _expiry_cutoff()),
+            ).fetchone()
 
-        return cached_data.get("metadata")
+        return _loads(row[0]) if row else None
 
     except Exception as e:
         logger.debug(f"Error reading cache: {e}")
         return None
 
 
+def flush_pending(cache_dir=None):
+    """
+    Write all deferred cache entries to disk.
+
+    Called periodically by a background timer and once at interpreter
+    shutdown. Pass cache_dir to flush only that directory's entries.
+    """
+    global _flush_timer
+
+    with _lock:
+        if cache_dir is None:
+            pending = dict(_pending_writes)
+            _pending_writes.clear()
+            if _flush_timer is not None:
+                _flush_timer.cancel()
+                _flush_timer = None
+        else:
+            pending = {
+                key: entry for key, entry in _pending_writes.items() if key[0] == cache_dir
+            }
+            for key in pending:
+                del _pending_writes[key]
+
+        # Group rows per database so each directory is one transaction
+        rows_by_dir = {}
+        for (pending_dir, cache_key), (url, ts, metadata) in pending.items():
+            rows_by_dir.setdefault(pending_dir, []).append(
+                (cache_key, url, ts, _dumps(metadata))
+            )
+
+        for pending_dir, rows in rows_by_dir.items():
+            try:
+                conn = _get_connection(pending_dir, create=True)
+                with conn:
+                    conn.executemany(
+                        "INSERT OR REPLACE INTO cache (key, url, ts, blob) "
+                        "VALUES (?, ?, ?, ?)",
+                        rows,
+                    )
+            except Exception as e:
+                logger.debug(f"Error writing cache: {e}")
+
+
+def _schedule_flush():
+    """Start the background flush timer if one is not already pending"""
+    global _flush_timer
+
+    if _flush_timer is None:
+        _flush_timer = threading.Timer(FLUSH_INTERVAL_SECONDS, flush_pending)
+        _flush_timer.daemon = True
+        _flush_timer.start()
+
+
 def save_cached_metadata(url, metadata, cache_dir=None):
-    """Save metadata to cache"""
+    """
+    Save metadata to cache
+
+    The write is deferred and batched with other entries; it becomes
+    visible to get_cached_metadata() immediately.
+    """
     if cache_dir is None:
         cache_dir = Config.cache_dir
 
-    try:
-        os.makedirs(cache_dir, exist_ok=True)
+    cache_key = get_cache_key(url)
+    ts = _now()
 
-        cache_key = get_cache_key(url)
-        cache_file = os.path.join(cache_dir, f"{cache_key}.pkl")
+    with _lock:
+        _pending_writes[(cache_dir, cache_key)] = (url, ts, metadata)
+        _schedule_flush()
 
-        cached_data = {"timestamp": datetime.now(), "url": url, "metadata": metadata}
+    # Keep a preloaded index in sync with what will be on disk
+    if cache_dir in _memory_cache:
+        _memory_cache[cache_dir][cache_key] = (ts, metadata)
 
-        with open(cache_file, "wb") as f:
-            pickle.dump(cached_data, f)
 
-    except Exception as e:
-        logger.debug(f"Error writing cache: {e}")
+def delete_cached_metadata(url, cache_dir=None):
+    """Remove a URL's cache entry, including any write still pending"""
+    if cache_dir is None:
+        cache_dir = Config.cache_dir
+
+    cache_key = get_cache_key(url)
+
+    with _lock:
+        _pending_writes.pop((cache_dir, cache_key), None)
+        if cache_dir in _memory_cache:
+            _memory_cache[cache_dir].pop(cache_key, None)
+
+        try:
+            conn = _get_connection(cache_dir)
+            if conn is not None:
+                with conn:
+                    conn.execute("DELETE FROM cache WHERE key = ?", (cache_key,))
+        except Exception as e:
+            logger.debug(f"Error deleting cache entry: {e}")
 
 
 def clear_cache(cache_dir=None):
@@ -77,12 +320,38 @@ def clear_cache(cache_dir=None):
     if cache_dir is None:
         cache_dir = Config.cache_dir
 
-    if os.path.exists(cache_dir):
-        import shutil
+    _memory_cache.pop(cache_dir, None)
 
-        shutil.rmtree(cache_dir)
-        logger.info(f"Cleared cache directory: {cache_dir}")
-        return True
-    else:
+    if not os.path.exists(cache_dir):
         logger.info(f"No cache directory found at: {cache_dir}")
         return False
+
+    with _lock:
+        for key in [key for key in _pending_writes if key[0] == cache_dir]:
+            del _pending_writes[key]
+
+        try:
+            conn = _get_connection(cache_dir)
+        except sqlite3.DatabaseError as e:
+            # A corrupt database cannot be emptied, so remove its files
+            logger.debug(f"Removing unreadable cache database: {e}")
+            conn = None
+            for suffix in ("", "-wal", "-shm"):
+                db_file = os.path.join(cache_dir, CACHE_DB_FILENAME + suffix)
+                if os.path.exists(db_file):
+                    os.remove(db_file)
+        if conn is not None:
+            with conn:
+                conn.execute("DELETE FROM cache")
+
+    # Remove per-URL files left over from the old file-per-entry layout
+    for pattern in ("*.pkl", "*.mp"):
+        for legacy_file in glob.glob(os.path.join(cache_dir, pattern)):
+            os.remove(legacy_file)
+
+    logger.info(f"Cleared cache in: {cache_dir}")
+    return True
+
+
+# Make sure deferred writes reach disk before the interpreter exits
+atexit.register(flush_pending)
@@ -10,6 +10,7 @@ This module consolidates all configuration in one place:
 """
 
 import os
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional
 
@@ -26,6 +27,15 @@ except ImportError:
     # dotenv not installed, rely on system environment variables
     PROJECT_ROOT = Path(__file__).parent.parent
 
+# Prefer the lxml parser for BeautifulSoup when it is installed; it is
+# several times faster than the pure-Python html.parser on large pages
+try:
+    import lxml  # noqa: F401
+
+    HTML_PARSER = "lxml"
+except ImportError:
+    HTML_PARSER = "html.parser"
+
 
 class Config:
     """
@@ -78,36 +88,53 @@ class Config:
     # === Cache Settings ===
     cache_expiry_days: int = 7  # Content cache expires after 7 days
 
+    @staticmethod
+    @lru_cache(maxsize=1)
+    def _build_headers(substack_cookie: str) -> dict:
+        """Build the headers dict for a given cookie (memoized)."""
+        return {
+            "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36",
+            "Cookie": substack_cookie,
+        }
+
     @classmethod
     def get_headers(cls) -> dict:
         """
         Generate HTTP headers for web scraping.
 
+        The same dict is returned until substack_cookie changes, so callers
+        must not mutate it.
+
         Returns:
             dict: Headers including User-Agent and session cookie
         """
-        return {
-            "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36",
-            "Cookie": cls.substack_cookie,
-        }
+        return cls._build_headers(cls.substack_cookie)
+
+    @staticmethod
+    @lru_cache(maxsize=1)
+    def _build_substack_url(substack_user: str) -> str:
+        """Build the reads URL for a given username (memoized)."""
+        if not substack_user:
+            return ""
+
+        # Ensure username starts with @
+        username = substack_user
+        if not username.startswith("@"):
+            username = f"@{username}"
+
+        return f"https://substack.com/{username}/reads"
 
     @classmethod
     def get_substack_url(cls) -> str:
         """
         Generate the Substack reads URL from username.
 
+        Cached until substack_user changes.
+
         Returns:
             str: Full URL to user's reads page, or empty string if user not set
         """
-        if not cls.substack_user:
-            return ""
-
-        # Ensure username starts with @
-        username = cls.substack_user
-        if not username.startswith("@"):
-            username = f"@{username}"
-
-        return f"https://substack.com/{username}/reads"
+        return cls._build_substack_url(cls.substack_user)
 
     @classmethod
     def validate(cls) -> list[str]:
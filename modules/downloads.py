@@ -4,24 +4,32 @@ Image download module with parallel and sequential support.
 
 import os
 import re
+import shutil
 import unicodedata
-import requests
 from urllib.parse import urlparse
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from .logger import get_logger
 from .config import Config
+from .session import get_session
 
 logger = get_logger(__name__)
 
+DOWNLOAD_CHUNK_SIZE = 256 * 1024
+
+_UNSAFE_FILENAME_CHARS = re.compile(r"[^\w\-_\.]")
+_REPEATED_UNDERSCORES = re.compile(r"_{2,}")
+
 
 def sanitize_filename(filename):
     """Sanitize filename for filesystem compatibility"""
     if not filename:
         return "unnamed_file"
 
-    filename = unicodedata.normalize("NFKD", filename)
-    filename = re.sub(r"[^\w\-_\.]", "_", filename)
-    filename = re.sub(r"_{2,}", "_", filename)
+    # NFKD leaves ASCII unchanged, so only normalize non-ASCII names
+    if not filename.isascii():
+        filename = unicodedata.normalize("NFKD", filename)
+    filename = _UNSAFE_FILENAME_CHARS.sub("_", filename)
+    filename = _REPEATED_UNDERSCORES.sub("_", filename)
     filename = filename.strip("_.")
 
     if not filename or filename.isspace():
@@ -35,49 +43,95 @@ def sanitize_filename(filename):
     return filename
 
 
-def download_image(url, folder_path, filename=None, skip_if_exists=True, timeout=None):
-    """Download an image from URL - Returns tuple (file_path, was_cached)"""
+def _image_file_path(url, folder_path, filename=None):
+    """Resolve the path an image from url will be saved to"""
+    if not filename:
+        parsed_url = urlparse(url)
+        filename = os.path.basename(parsed_url.path)
+        if "." not in filename:
+            filename += ".jpg"
+
+    filename = sanitize_filename(filename)
+    return os.path.join(folder_path, filename)
+
+
+def _is_downloaded(file_path):
+    """Check for a non-empty file at file_path, removing empty leftovers"""
+    # One stat() call instead of separate exists() and getsize() calls
+    try:
+        if os.stat(file_path).st_size > 0:
+            return True
+        os.remove(file_path)
+    except FileNotFoundError:
+        pass
+    return False
+
+
+def _fetch_image(url, file_path, timeout=None):
+    """Stream an image from URL into file_path - Returns tuple (file_path, was_cached)"""
     if timeout is None:
         timeout = Config.timeout
 
     try:
-        if not filename:
-            parsed_url = urlparse(url)
-            filename = os.path.basename(parsed_url.path)
-            if "." not in filename:
-                filename += ".jpg"
+        # Closing the streamed response returns its connection to the pool
+        # even when the status check or the copy fails
+        with get_session().get(url, stream=True, timeout=timeout) as response:
+            response.raise_for_status()
 
-        filename = sanitize_filename(filename)
-        file_path = os.path.join(folder_path, filename)
+            # Copy the raw stream in large chunks so the loop stays in C
+            response.raw.decode_content = True
+            with open(file_path, "wb") as f:
+                shutil.copyfileobj(response.raw, f, length=DOWNLOAD_CHUNK_SIZE)
 
-        if skip_if_exists and os.path.exists(file_path):
-            if os.path.getsize(file_path) > 0:
-                return file_path, True
-            else:
-                os.remove(file_path)
+        return file_path, False
 
-        response = requests.get(url, headers=Config.get_headers(), stream=True, timeout=timeout)
-        response.raise_for_status()
+    except Exception as e:
+        logger.debug(f"Error downloading image {url}: {e}")
+        return None, False
 
-        with open(file_path, "wb") as f:
-            for chunk in response.iter_content(chunk_size=8192):
-                f.write(chunk)
 
-        return file_path, False
+def download_image(url, folder_path, filename=None, skip_if_exists=True, timeout=None):
+    """Download an image from URL - Returns tuple (file_path, was_cached)"""
+    try:
+        file_path = _image_file_path(url, folder_path, filename)
+
+        if skip_if_exists and _is_downloaded(file_path):
+            return file_path, True
 
     except Exception as e:
         logger.debug(f"Error downloading image {url}: {e}")
         return None, False
 
+    return _fetch_image(url, file_path, timeout)
+
 
 def download_images_parallel(image_tasks, max_workers=5):
     """Download multiple images in parallel - Returns dict mapping index to (file_path, was_cached)"""
     results = {}
 
-    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+    # Resolve already-downloaded images inline; on repeat runs most icons
+    # are on disk and dispatching them to worker threads is pure overhead
+    pending = {}
+    for idx, (url, folder, filename) in enumerate(image_tasks):
+        try:
+            file_path = _image_file_path(url, folder, filename)
+            if _is_downloaded(file_path):
+                results[idx] = (file_path, True)
+                continue
+        except Exception as e:
+            logger.debug(f"Error checking image {url}: {e}")
+            results[idx] = (None, False)
+            continue
+        # Workers reuse the path resolved here instead of sanitizing again
+        pending[idx] = (url, file_path)
+
+    if not pending:
+        return results
+
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(pending))) as executor:
         future_to_index = {
-            executor.submit(download_image, url, folder, filename, True): idx
-            for idx, (url, folder, filename) in enumerate(image_tasks)
+            executor.submit(_fetch_image, url, file_path): idx
+            for idx, (url, file_path) in pending.items()
         }
 
         for future in as_completed(future_to_index):
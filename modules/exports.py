@@ -10,6 +10,12 @@ from datetime import datetime
 from xml.dom import minidom
 from .config import Config
 
+# orjson is optional: it serializes large exports much faster than json
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 
 def save_to_csv(data, filename=None):
     """Save the scraped data to a CSV file"""
@@ -22,10 +28,8 @@ def save_to_csv(data, filename=None):
 
     os.makedirs(os.path.dirname(filename), exist_ok=True)
 
-    # Collect all unique keys
-    all_keys = set()
-    for row in data:
-        all_keys.update(row.keys())
+    # Collect all unique keys in a single C-level union
+    all_keys = set().union(*(row.keys() for row in data))
 
     # Define preferred order
     preferred_order = [
@@ -43,17 +47,20 @@ def save_to_csv(data, filename=None):
     ]
 
     fieldnames = [field for field in preferred_order if field in all_keys]
-    fieldnames.extend(sorted(all_keys - set(fieldnames)))
+    fieldnames.extend(sorted(all_keys.difference(preferred_order)))
 
     with open(filename, "w", newline="", encoding="utf-8") as csvfile:
         writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
         writer.writeheader()
-        for row in data:
-            csv_row = row.copy()
-            for key, value in csv_row.items():
-                if isinstance(value, list):
-                    csv_row[key] = ", ".join(str(v) for v in value)
-            writer.writerow(csv_row)
+        # Stream rows through a generator, joining list values on the fly
+        # instead of copying every row first
+        writer.writerows(
+            {
+                key: ", ".join(map(str, value)) if isinstance(value, list) else value
+                for key, value in row.items()
+            }
+            for row in data
+        )
     print(f"✓ Data saved to {filename}")
 
 
@@ -64,8 +71,13 @@ def save_to_json(data, filename=None):
 
     os.makedirs(os.path.dirname(filename), exist_ok=True)
 
-    with open(filename, "w", encoding="utf-8") as f:
-        json.dump(data, f, indent=2, ensure_ascii=False)
+    if orjson:
+        # orjson emits UTF-8 bytes, matching ensure_ascii=False output
+        with open(filename, "wb") as f:
+            f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
+    else:
+        with open(filename, "w", encoding="utf-8") as f:
+            json.dump(data, f, indent=2, ensure_ascii=False)
     print(f"✓ Data saved to {filename}")
 
 
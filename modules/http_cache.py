@@ -0,0 +1,79 @@
+"""
+Conditional GET support for pages fetched on every run.
+
+The response body is stored with its ETag/Last-Modified validators in a
+separate SQLite cache (.cache/http/cache.db). Later requests send them
+back, and a 304 Not Modified reply is answered from the stored copy.
+"""
+
+import os
+from .cache import delete_cached_metadata, get_cached_metadata, save_cached_metadata
+from .config import Config
+from .logger import get_logger
+from .session import get_session
+
+logger = get_logger(__name__)
+
+HTTP_CACHE_DIRNAME = "http"
+
+
+def http_cache_dir():
+    """Directory holding the conditional GET cache"""
+    return os.path.join(Config.cache_dir, HTTP_CACHE_DIRNAME)
+
+
+def _decode_body(response):
+    """Decode a response body with the declared charset, or UTF-8"""
+    # requests assumes ISO-8859-1 for text/* without a charset, so only
+    # trust response.encoding when the server declared one; no charset
+    # detection pass over the whole page
+    encoding = None
+    if "charset" in response.headers.get("Content-Type", "").lower():
+        encoding = response.encoding
+    return response.content.decode(encoding or "utf-8", errors="replace")
+
+
+def fetch_page(url, timeout=None):
+    """
+    GET a page, revalidating a cached copy when one exists.
+
+    Returns the decoded page body as str, the same value whether it came
+    from the network or the cache; raises requests exceptions like a plain
+    get() followed by raise_for_status().
+    """
+    if timeout is None:
+        timeout = Config.timeout
+
+    cache_dir = http_cache_dir()
+    cached = get_cached_metadata(url, cache_dir) if Config.use_cache else None
+
+    headers = {}
+    if cached:
+        if cached.get("etag"):
+            headers["If-None-Match"] = cached["etag"]
+        if cached.get("last_modified"):
+            headers["If-Modified-Since"] = cached["last_modified"]
+
+    response = get_session().get(url, headers=headers, timeout=timeout)
+    if cached and response.status_code == 304:
+        logger.debug(f"Not modified, using cached copy of {url}")
+        # Re-save so a page that keeps validating does not expire
+        save_cached_metadata(url, cached, cache_dir)
+        return cached["body"]
+    response.raise_for_status()
+
+    body = _decode_body(response)
+    etag = response.headers.get("ETag")
+    last_modified = response.headers.get("Last-Modified")
+    if Config.use_cache:
+        if etag or last_modified:
+            save_cached_metadata(
+                url,
+                {"etag": etag, "last_modified": last_modified, "body": body},
+                cache_dir,
+            )
+        elif cached:
+            # Without a validator the server cannot answer 304; drop the old
+            # entry so its stale validators are not sent next time
+            delete_cached_metadata(url, cache_dir)
+    return body
@@ -2,35 +2,91 @@
 Auto-labeling and label filtering module.
 """
 
+import logging
 import re
-from urllib.parse import urlparse
-from .cache import get_cached_metadata
-from .metadata import analyze_publication_content
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import lru_cache
+from .cache import get_cached_metadata, preload_cache, save_cached_metadata
+from .categories import KEYWORD_CATEGORIES
+from .config import Config
+from .metadata import (
+    analyze_publication_content,
+    extract_author_profile_url,
+    fetch_author_bio,
+)
 from .logger import get_logger, ProgressBar
 
-logger = get_logger(__name__)
+# pyahocorasick is optional: one automaton pass per text source finds every
+# keyword it contains, replacing the per-keyword regex scans
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
 
+logger = get_logger(__name__)
 
+_lowered_categories = None
+_keyword_automaton = None
+_category_patterns = None
+
+_WORD_RE = re.compile(r'\w+')
+
+# Common TLDs and subdomains that carry no topical meaning
+_SKIP_URL_PARTS = frozenset({'www', 'com', 'org', 'net', 'substack', 'io', 'co'})
+
+# Fallback rules for publications no category matched:
+# substrings of the publication name, and whole URL keywords, to labels
+_NAME_FALLBACKS = {
+    "objection": "law",
+    "lawyer": "law",
+    "legal": "law",
+    "music": "music",
+    "band": "music",
+    "song": "music",
+}
+_URL_FALLBACKS = {
+    "tech": "tech",
+    "code": "tech",
+    "dev": "tech",
+    "engineering": "tech",
+    "news": "news",
+    "daily": "news",
+    "weekly": "news",
+    "newsletter": "news",
+    "music": "music",
+    "band": "music",
+    "album": "music",
+    "objection": "law",
+    "legal": "law",
+    "lawyer": "law",
+}
+
+
+@lru_cache(maxsize=8192)
 def extract_url_keywords(url):
-    """Extract potential keywords from URL structure"""
+    """Extract potential keywords from URL structure (as a tuple)"""
     if not url:
-        return []
-
-    parsed = urlparse(url.lower())
-    domain_parts = parsed.netloc.split('.')
-    path_parts = parsed.path.strip('/').split('/')
-
-    keywords = []
-    for part in domain_parts + path_parts:
-        # Remove common TLDs and subdomains
-        if part not in ['www', 'com', 'org', 'net', 'substack', 'io', 'co']:
-            keywords.append(part)
-
-    return keywords
-
-
-def word_boundary_search(text, keyword):
-    """Search for keyword with word boundaries to avoid partial matches"""
+        return ()
+
+    # Plain string splitting; publication links are simple scheme://host/path
+    # URLs, so urlparse's general-purpose parsing is not needed
+    url = url.lower()
+    if "://" in url:
+        url = url.split("://", 1)[1]
+    url = url.split("?", 1)[0].split("#", 1)[0]
+    host, _, path = url.partition("/")
+
+    # Remove common TLDs and subdomains
+    return tuple(
+        part
+        for part in host.split(".") + path.strip("/").split("/")
+        if part and part not in _SKIP_URL_PARTS
+    )
+
+
+@lru_cache(maxsize=4096)
+def _compile_keyword(keyword):
+    """Compile the word-boundary pattern for a keyword once"""
     # Escape special regex characters in keyword
     escaped_keyword = re.escape(keyword)
     # Use word boundaries (\b) for single words, looser matching for phrases
@@ -40,185 +96,420 @@ def word_boundary_search(text, keyword):
     else:
         pattern = r'\b' + escaped_keyword + r'\b'
 
-    return bool(re.search(pattern, text, re.IGNORECASE))
+    return re.compile(pattern, re.IGNORECASE)
+
 
+@lru_cache(maxsize=4096)
+def _is_single_word(keyword):
+    """True if keyword is one run of word characters (no spaces or punctuation)"""
+    return _WORD_RE.fullmatch(keyword) is not None
 
-def calculate_category_score(category, keywords, text_sources):
-    """Calculate weighted score for a category based on where keywords match"""
+
+def word_boundary_search(text, keyword):
+    """Search for keyword with word boundaries to avoid partial matches"""
+    return _compile_keyword(keyword).search(text) is not None
+
+
+def _get_lowered_categories():
+    """Return [(category, lowercased keywords)] built once from KEYWORD_CATEGORIES"""
+    global _lowered_categories
+    if _lowered_categories is None:
+        _lowered_categories = [
+            (category, tuple(keyword.lower() for keyword in keywords))
+            for category, keywords in KEYWORD_CATEGORIES.items()
+        ]
+    return _lowered_categories
+
+
+def _get_keyword_automaton():
+    """Build the Aho-Corasick automaton over all category keywords once"""
+    global _keyword_automaton
+    if _keyword_automaton is None:
+        automaton = ahocorasick.Automaton()
+        for category, keywords in _get_lowered_categories():
+            for keyword in keywords:
+                if keyword in automaton:
+                    automaton.get(keyword)[1].append((category, keyword))
+                else:
+                    automaton.add_word(keyword, (keyword, [(category, keyword)]))
+        automaton.make_automaton()
+        _keyword_automaton = automaton
+    return _keyword_automaton
+
+
+def _get_category_patterns():
+    """Compile one alternation regex per category for screening (fallback path)"""
+    global _category_patterns
+    if _category_patterns is None:
+        _category_patterns = {
+            category: re.compile('|'.join(re.escape(keyword) for keyword in keywords))
+            for category, keywords in _get_lowered_categories()
+        }
+    return _category_patterns
+
+
+def _is_word_char(char):
+    """Check a single character against the regex word-character class"""
+    return char.isalnum() or char == '_'
+
+
+def build_text_source_tuples(text_sources, tokens=None):
+    """
+    Flatten text_sources into (text, tokens, weight, label) tuples.
+
+    Built once per publication and shared by every scorer instead of each
+    one re-reading and re-normalizing the dict. Sources are ordered by
+    match value (author bio, name, URL, author, content); empty ones are
+    dropped. Texts are whitespace-collapsed so multi-word keywords match
+    across line breaks. tokens is the optional result of
+    tokenize_text_sources(text_sources).
+    """
+    if tokens is None:
+        tokens = {}
+
+    # Highest-value matches: known author bio (verified information),
+    # then name and URL, then author; content is lower-value but still useful.
+    layout = (
+        (text_sources.get('author_bio', ''), 'author_bio', 4, "author bio"),
+        (text_sources.get('name', ''), 'name', 3, "name"),
+        (' '.join(text_sources.get('url_keywords', [])), 'url_keywords', 2, "URL"),
+        (text_sources.get('author', ''), 'author', 1, "author"),
+        (text_sources.get('content', ''), 'content', 1.5, "content"),
+    )
+    return tuple(
+        (' '.join(text.split()), tokens.get(key), weight, label)
+        for text, key, weight, label in layout
+        if text
+    )
+
+
+def score_categories_with_automaton(text_sources, sources=None):
+    """
+    Score every category in one automaton pass per text source.
+
+    Equivalent to calling calculate_category_score() for each category:
+    a keyword counts once per source it appears in as a whole word, with
+    the same per-source weights. Requires pyahocorasick.
+    text_sources values must already be lowercase (see _label_publication);
+    sources is the optional result of build_text_source_tuples().
+    Returns a dict mapping category to (score, matches); matches are only
+    collected when debug logging is enabled.
+    """
+    automaton = _get_keyword_automaton()
+    debug = logger.isEnabledFor(logging.DEBUG)
+    if sources is None:
+        sources = build_text_source_tuples(text_sources)
+
+    results = {}
+    for text, _, weight, label in sources:
+        last = len(text) - 1
+        seen = set()
+        for end, (keyword_lower, hits) in automaton.iter(text):
+            if keyword_lower in seen:
+                continue
+            # Whole-word check on the bordering characters instead of \b
+            start = end - len(keyword_lower) + 1
+            if start > 0 and _is_word_char(text[start - 1]):
+                continue
+            if end < last and _is_word_char(text[end + 1]):
+                continue
+            seen.add(keyword_lower)
+            for category, keyword in hits:
+                score, matches = results.get(category, (0, []))
+                if debug:
+                    matches.append(f"{keyword} in {label}")
+                results[category] = (score + weight, matches)
+    return results
+
+
+def find_keyword_candidates(text_sources, sources=None):
+    """
+    Find the categories whose keywords may occur in the text sources.
+
+    Used when pyahocorasick is not installed: a per-category regex screens
+    out categories with no possible match. Returns the set of remaining
+    category names; their keywords still need the word-boundary check in
+    calculate_category_score().
+    sources is the optional result of build_text_source_tuples().
+    """
+    if sources is None:
+        sources = build_text_source_tuples(text_sources)
+    # Keep sources on separate lines so no keyword spans two of them
+    combined_text = '\n'.join(text for text, _, _, _ in sources)
+
+    patterns = _get_category_patterns()
+    return {
+        category
+        for category, _ in _get_lowered_categories()
+        if patterns[category].search(combined_text)
+    }
+
+
+def tokenize_text_sources(text_sources):
+    """Tokenize every (already lowercase) text source once for reuse in scoring"""
+    return {
+        'name': frozenset(_WORD_RE.findall(text_sources.get('name', ''))),
+        'author': frozenset(_WORD_RE.findall(text_sources.get('author', ''))),
+        'url_keywords': frozenset(
+            _WORD_RE.findall(' '.join(text_sources.get('url_keywords', [])))
+        ),
+        'content': frozenset(_WORD_RE.findall(text_sources.get('content', ''))),
+        'author_bio': frozenset(_WORD_RE.findall(text_sources.get('author_bio', ''))),
+    }
+
+
+def calculate_category_score(category, keywords, text_sources, tokens=None, sources=None):
+    """
+    Calculate weighted score for a category based on where keywords match
+
+    keywords must already be lowercase, as returned by
+    _get_lowered_categories(), and so must the text_sources values.
+    tokens is the optional result of tokenize_text_sources(text_sources),
+    and sources of build_text_source_tuples(); pass sources when scoring
+    many categories for one publication so it is only built once.
+    Match descriptions are only built when debug logging is enabled.
+    """
     score = 0
     matches = []
+    debug = logger.isEnabledFor(logging.DEBUG)
 
-    name_text = text_sources.get('name', '').lower()
-    author_text = text_sources.get('author', '').lower()
-    url_text = ' '.join(text_sources.get('url_keywords', [])).lower()
-    content_text = text_sources.get('content', '').lower()
-    author_bio_text = text_sources.get('author_bio', '').lower()
+    if sources is None:
+        sources = build_text_source_tuples(text_sources, tokens)
 
     for keyword in keywords:
-        keyword_lower = keyword.lower()
+        single_word = _is_single_word(keyword)
+        for text, source_tokens, weight, label in sources:
+            if single_word and source_tokens is not None:
+                found = keyword in source_tokens
+            else:
+                # Cheap substring scan before the regex word-boundary check
+                found = keyword in text and word_boundary_search(text, keyword)
+            if found:
+                score += weight
+                if debug:
+                    matches.append(f"{keyword} in {label}")
 
-        # Highest-value matches: known author bio (verified information)
-        if author_bio_text and word_boundary_search(author_bio_text, keyword_lower):
-            score += 4
-            matches.append(f"{keyword} in author bio")
+    return score, matches
 
-        # High-value matches: name and URL
-        if word_boundary_search(name_text, keyword_lower):
-            score += 3
-            matches.append(f"{keyword} in name")
 
-        if word_boundary_search(url_text, keyword_lower):
-            score += 2
-            matches.append(f"{keyword} in URL")
+def _fetch_author_bio(author_profile_url, use_cache=True):
+    """Get an author bio from cache or their Substack profile"""
+    # Check cache for author bio
+    cached_author_bio = get_cached_metadata(f"author_bio_{author_profile_url}") if use_cache else None
+    if cached_author_bio:
+        logger.debug(f"Using cached author bio from profile")
+        return cached_author_bio.get("bio_text", "")
+
+    logger.debug(f"Fetching author bio from profile: {author_profile_url}")
+    bio_text = fetch_author_bio(author_profile_url)
+    if bio_text:
+        # Cache the author bio
+        if use_cache:
+            save_cached_metadata(f"author_bio_{author_profile_url}", {"bio_text": bio_text})
+        logger.debug(f"Author bio fetched ({len(bio_text)} chars): {bio_text[:100]}...")
+    return bio_text
+
+
+def _fetch_content(link, use_cache=True):
+    """Get publication content text from cache or the publication page"""
+    cached_metadata = get_cached_metadata(link) if use_cache else None
+    if cached_metadata:
+        logger.debug(f"Using cached content analysis")
+        content = cached_metadata.get("content_text", "")
+    else:
+        logger.debug(f"Fetching content from {link}...")
+        content = analyze_publication_content(link)
 
-        # Medium-value matches: author
-        if word_boundary_search(author_text, keyword_lower):
-            score += 1
-            matches.append(f"{keyword} in author")
+    if content:
+        logger.debug(f"Content analyzed ({len(content)} chars)")
+    else:
+        logger.debug(f"Could not analyze content")
+    return content
+
+
+def _fetch_text_sources(publications, use_cache=True):
+    """
+    Fetch content text and author bios for all publications concurrently.
+
+    Cache hits are resolved inline; only misses are fanned out to a thread
+    pool, since each one is a rate-limited network round-trip, with a
+    progress bar advancing as each fetch completes.
+    Returns (contents, bios) dicts keyed by publication link and author
+    profile URL.
+    """
+    links = set()
+    profile_urls = set()
+    for pub in publications:
+        if pub.get("link"):
+            links.add(pub["link"])
+            author_profile_url = extract_author_profile_url(pub["link"])
+            if author_profile_url:
+                profile_urls.add(author_profile_url)
 
-        # Lower-value matches: content (but still valuable)
-        if content_text and word_boundary_search(content_text, keyword_lower):
-            score += 1.5
-            matches.append(f"{keyword} in content")
+    contents = {}
+    bios = {}
+    if use_cache:
+        for link in links:
+            cached_metadata = get_cached_metadata(link)
+            if cached_metadata:
+                contents[link] = cached_metadata.get("content_text", "") or ""
+        for url in profile_urls:
+            cached_author_bio = get_cached_metadata(f"author_bio_{url}")
+            if cached_author_bio:
+                bios[url] = cached_author_bio.get("bio_text", "") or ""
+
+    missing_links = [link for link in links if link not in contents]
+    missing_profiles = [url for url in profile_urls if url not in bios]
+    if not missing_links and not missing_profiles:
+        return contents, bios
+
+    progress = ProgressBar(len(missing_links) + len(missing_profiles), "Fetching")
+    with ThreadPoolExecutor(max_workers=Config.max_workers) as executor:
+        futures = {
+            executor.submit(_fetch_author_bio, url, use_cache): (bios, url)
+            for url in missing_profiles
+        }
+        futures.update(
+            {
+                executor.submit(_fetch_content, link, use_cache): (contents, link)
+                for link in missing_links
+            }
+        )
+        for future in as_completed(futures):
+            results, key = futures[future]
+            results[key] = future.result() or ""
+            progress.update(1, key.split("//", 1)[-1][:30])
+
+    return contents, bios
+
+
+def _label_publication(pub, content="", author_bio=""):
+    """Compute and assign labels for a single publication"""
+    labels = set()
+    debug = logger.isEnabledFor(logging.DEBUG)
+    if debug:
+        logger.debug(f"Analyzing publication: {pub.get('name', 'Unknown')}")
 
-    return score, matches
+    # Prepare text sources dictionary, lowercased once here for all scorers.
+    # URL keywords are lowercased by extract_url_keywords(), and content_text
+    # is already stored lowercase by extract_metadata().
+    text_sources = {
+        'name': pub.get("name", "").lower(),
+        'author': pub.get("author", "").lower(),
+        'url_keywords': extract_url_keywords(pub.get("link", "")),
+        'content': content,
+        'author_bio': author_bio.lower()
+    }
+
+    # Calculate scores for each category
+    if ahocorasick is not None:
+        scored = score_categories_with_automaton(
+            text_sources, build_text_source_tuples(text_sources)
+        )
+    else:
+        tokens = tokenize_text_sources(text_sources)
+        sources = build_text_source_tuples(text_sources, tokens)
+        # Skip categories that cannot match any text source
+        candidates = find_keyword_candidates(text_sources, sources)
+        scored = {}
+        for category, keywords in _get_lowered_categories():
+            if category not in candidates:
+                continue
+            scored[category] = calculate_category_score(
+                category, keywords, text_sources, tokens, sources
+            )
+
+    category_scores = {}
+    for category, (score, matches) in scored.items():
+        if score > 0:
+            category_scores[category] = {'score': score, 'matches': matches}
+            if debug:
+                logger.debug(f"  {category}: score={score:.1f}, matches={matches[:3]}")
+
+    # Apply labels based on score thresholds
+    for category, data in category_scores.items():
+        score = data['score']
+        # Lower threshold: any match gets a label
+        if score >= 1:
+            labels.add(category)
+        # Higher threshold for "focused" designation
+        if score >= 5:
+            labels.add(f"{category}-focused")
+
+    # Fallback strategies for publications with few/no labels
+    if not labels:  # No labels assigned yet
+        logger.debug(f"  Applying fallback strategies (current labels: {labels})")
+
+        # Strategy 1: Infer from publication name patterns
+        name_lower = text_sources['name']
+        author_lower = text_sources['author']
+
+        # Check for personal newsletters (name matches author)
+        if author_lower and name_lower:
+            if author_lower in name_lower:
+                labels.add("writing")
+                logger.debug(f"  Fallback: Added 'writing' (personal newsletter)")
+
+        # Strategy 2: Check for title-only publications (often opinion/commentary)
+        if not author_lower or author_lower == name_lower:
+            labels.add("writing")
+            logger.debug(f"  Fallback: Added 'writing' (single-author format)")
+
+        # Strategy 3: Contextual name inference
+        for token, label in _NAME_FALLBACKS.items():
+            if token in name_lower:
+                labels.add(label)
+                logger.debug(f"  Fallback: Added '{label}' from name context ({token})")
+
+        # Check for possessive names (often personal commentary)
+        if "'s " in name_lower or "by" in name_lower:
+            if "law" not in labels and "music" not in labels:
+                labels.add("writing")
+                logger.debug(f"  Fallback: Added 'writing' (possessive format)")
+
+        # Strategy 4: URL pattern inference
+        url_keywords = text_sources.get('url_keywords', [])
+        for kw in url_keywords:
+            if len(kw) > 3:  # Avoid short meaningless strings
+                # Check if URL keyword suggests a category
+                label = _URL_FALLBACKS.get(kw)
+                if label:
+                    labels.add(label)
+                    logger.debug(f"  Fallback: Added '{label}' from URL ({kw})")
+
+    pub["labels"] = sorted(labels)
+    if debug:
+        logger.debug(f"Final labels: {', '.join(pub['labels'])}")
+
+
+def _needs_labels(pub, skip_if_labeled=True):
+    """Whether pub should be (re)labeled"""
+    return not (skip_if_labeled and pub.get("labels") and len(pub["labels"]) > 0)
 
 
 def auto_label_publications(
     publications, analyze_content=True, skip_if_labeled=True, use_cache=True
 ):
     """Automatically assign labels based on publication characteristics"""
-    from .categories import KEYWORD_CATEGORIES
-
+    # Phase 1 (network-bound): fetch content and author bios concurrently
+    to_label = [pub for pub in publications if _needs_labels(pub, skip_if_labeled)]
+    contents, bios = {}, {}
+    if analyze_content and to_label:
+        # Load the whole cache once instead of one disk lookup per publication
+        if use_cache:
+            preload_cache()
+        contents, bios = _fetch_text_sources(to_label, use_cache)
+
+    # Phase 2 (CPU-bound): score every publication from the fetched text
     progress = ProgressBar(len(publications), "Labeling")
-
-    for i, pub in enumerate(publications, 1):
-        if skip_if_labeled and pub.get("labels") and len(pub["labels"]) > 0:
+    for pub in publications:
+        if not _needs_labels(pub, skip_if_labeled):
             logger.debug(f"Skipping {pub.get('name', 'Unknown')} (already labeled)")
             progress.update(1, f"Skipped: {pub.get('name', 'Unknown')[:30]}")
             continue
-
-        labels = []
-        logger.debug(f"Analyzing publication: {pub.get('name', 'Unknown')}")
-
-        # Prepare text sources dictionary
-        text_sources = {
-            'name': pub.get("name", ""),
-            'author': pub.get("author", ""),
-            'url_keywords': extract_url_keywords(pub.get("link", "")),
-            'content': "",
-            'author_bio': ""
-        }
-
-        # Fetch author bio from Substack profile
-        if analyze_content and pub.get("link"):
-            from .metadata import extract_author_profile_url, fetch_author_bio
-
-            author_profile_url = extract_author_profile_url(pub["link"])
-            if author_profile_url:
-                # Check cache for author bio
-                cached_author_bio = get_cached_metadata(f"author_bio_{author_profile_url}") if use_cache else None
-                if cached_author_bio:
-                    logger.debug(f"Using cached author bio from profile")
-                    text_sources['author_bio'] = cached_author_bio.get("bio_text", "")
-                else:
-                    logger.debug(f"Fetching author bio from profile: {author_profile_url}")
-                    bio_text = fetch_author_bio(author_profile_url)
-                    if bio_text:
-                        text_sources['author_bio'] = bio_text
-                        # Cache the author bio
-                        if use_cache:
-                            from .cache import save_cached_metadata
-                            save_cached_metadata(f"author_bio_{author_profile_url}", {"bio_text": bio_text})
-                        logger.debug(f"Author bio fetched ({len(bio_text)} chars): {bio_text[:100]}...")
-
-        # Add content analysis if enabled
-        if analyze_content and pub.get("link"):
-            cached_metadata = get_cached_metadata(pub["link"]) if use_cache else None
-            if cached_metadata:
-                logger.debug(f"Using cached content analysis")
-                text_sources['content'] = cached_metadata.get("content_text", "")
-            else:
-                logger.debug(f"Fetching content from {pub['link']}...")
-                text_sources['content'] = analyze_publication_content(pub["link"])
-
-            if text_sources['content']:
-                logger.debug(f"Content analyzed ({len(text_sources['content'])} chars)")
-            else:
-                logger.debug(f"Could not analyze content")
-
-        # Calculate scores for each category
-        category_scores = {}
-        for category, keywords in KEYWORD_CATEGORIES.items():
-            score, matches = calculate_category_score(category, keywords, text_sources)
-            if score > 0:
-                category_scores[category] = {'score': score, 'matches': matches}
-                logger.debug(f"  {category}: score={score:.1f}, matches={matches[:3]}")
-
-        # Apply labels based on score thresholds
-        for category, data in category_scores.items():
-            score = data['score']
-            # Lower threshold: any match gets a label
-            if score >= 1:
-                labels.append(category)
-            # Higher threshold for "focused" designation
-            if score >= 5:
-                labels.append(f"{category}-focused")
-
-        # Fallback strategies for publications with few/no labels
-        if len(labels) == 0:  # No labels assigned yet
-            logger.debug(f"  Applying fallback strategies (current labels: {labels})")
-
-            # Strategy 1: Infer from publication name patterns
-            name_lower = pub.get("name", "").lower()
-            author_lower = pub.get("author", "").lower()
-
-            # Check for personal newsletters (name matches author)
-            if author_lower and name_lower:
-                if author_lower in name_lower:
-                    labels.append("writing")
-                    logger.debug(f"  Fallback: Added 'writing' (personal newsletter)")
-
-            # Strategy 2: Check for title-only publications (often opinion/commentary)
-            if not author_lower or author_lower == name_lower:
-                labels.append("writing")
-                logger.debug(f"  Fallback: Added 'writing' (single-author format)")
-
-            # Strategy 3: Contextual name inference
-            if "objection" in name_lower or "lawyer" in name_lower or "legal" in name_lower:
-                labels.append("law")
-                logger.debug(f"  Fallback: Added 'law' from name context")
-
-            if "music" in name_lower or "band" in name_lower or "song" in name_lower:
-                labels.append("music")
-                logger.debug(f"  Fallback: Added 'music' from name context")
-
-            # Check for possessive names (often personal commentary)
-            if "'s " in name_lower or "by" in name_lower:
-                if "law" not in labels and "music" not in labels:
-                    labels.append("writing")
-                    logger.debug(f"  Fallback: Added 'writing' (possessive format)")
-
-            # Strategy 4: URL pattern inference
-            url_keywords = text_sources.get('url_keywords', [])
-            for kw in url_keywords:
-                if len(kw) > 3:  # Avoid short meaningless strings
-                    # Check if URL keyword suggests a category
-                    if kw in ['tech', 'code', 'dev', 'engineering']:
-                        labels.append("tech")
-                        logger.debug(f"  Fallback: Added 'tech' from URL ({kw})")
-                    elif kw in ['news', 'daily', 'weekly', 'newsletter']:
-                        labels.append("news")
-                        logger.debug(f"  Fallback: Added 'news' from URL ({kw})")
-                    elif kw in ['music', 'band', 'album']:
-                        labels.append("music")
-                        logger.debug(f"  Fallback: Added 'music' from URL ({kw})")
-                    elif kw in ['objection', 'legal', 'lawyer']:
-                        labels.append("law")
-                        logger.debug(f"  Fallback: Added 'law' from URL ({kw})")
-
-        pub["labels"] = sorted(list(set(labels)))
-        logger.debug(f"Final labels: {', '.join(pub['labels'])}")
+        link = pub.get("link")
+        author_bio = bios.get(extract_author_profile_url(link), "") if link else ""
+        _label_publication(pub, contents.get(link, ""), author_bio)
         progress.update(1, f"{pub.get('name', 'Unknown')[:30]}")
 
     return publications
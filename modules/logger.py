@@ -4,6 +4,7 @@ Logging configuration and utilities for the Substack scraper.
 
 import logging
 import sys
+import time
 from typing import Optional
 
 
@@ -108,6 +109,12 @@ class ProgressBar:
         self.width = width
         self.logger = get_logger(__name__)
         self.last_line_length = 0  # Track last line length to clear properly
+        self._last_draw = 0.0
+        self._min_interval = 0.05  # Redraw at most ~20 times per second
+        self._last_filled = -1
+        self._bar_cache = ""
+        self._last_status = ""
+        self._finished = False  # Final line (with newline) already written
 
     def update(self, n: int = 1, status: str = ""):
         """
@@ -120,11 +127,28 @@ class ProgressBar:
         self.current += n
         if self.current > self.total:
             self.current = self.total
+        self._last_status = status
+
+        # Throttle terminal writes; always draw the final state
+        now = time.monotonic()
+        if now - self._last_draw < self._min_interval and self.current < self.total:
+            return
+        self._last_draw = now
+        self._draw(status)
+
+    def _draw(self, status: str = ""):
+        """Write the current state of the bar to the terminal"""
+        if self._finished:
+            return
 
         # Calculate progress
         progress = self.current / self.total if self.total > 0 else 1.0
         filled = int(self.width * progress)
-        bar = "█" * filled + "░" * (self.width - filled)
+        # Only rebuild the bar glyphs when another cell fills in
+        if filled != self._last_filled:
+            self._bar_cache = "█" * filled + "░" * (self.width - filled)
+            self._last_filled = filled
+        bar = self._bar_cache
 
         # Build status line - truncate status to prevent line wrapping
         percent = progress * 100
@@ -151,9 +175,19 @@ class ProgressBar:
         if self.current >= self.total:
             sys.stdout.write("\n")
             sys.stdout.flush()
+            self._finished = True
 
     def finish(self):
-        """Complete the progress bar"""
-        if self.current < self.total:
-            self.current = self.total
-            self.update(0)
+        """
+        Draw the latest state and end the line.
+
+        Callers that skip update() for some items never reach total, so the
+        throttled bar would otherwise stay on a stale count without a newline.
+        """
+        if self._finished:
+            return
+        self._draw(self._last_status)
+        if not self._finished:
+            sys.stdout.write("\n")
+            sys.stdout.flush()
+            self._finished = True
@@ -7,11 +7,34 @@ from bs4 import BeautifulSoup
 import re
 import time
 from .cache import get_cached_metadata, save_cached_metadata
-from .config import Config
+from .config import Config, HTML_PARSER
 from .logger import get_logger
+from .session import get_session
 
 logger = get_logger(__name__)
 
+# Subscriber count patterns, tried in order against the page text
+_SUBSCRIBER_PATTERNS = [
+    (re.compile(r"(\d+[,\d]*)\s+subscribers?", re.IGNORECASE), "subscribers"),
+    (re.compile(r"(\d+[,\d]*)\s+readers?", re.IGNORECASE), "readers"),
+    (re.compile(r"(\d+[KkMm])\s+subscribers?", re.IGNORECASE), "subscribers"),
+]
+
+# Headings that introduce an about section, tried in order
+_ABOUT_HEADING_PATTERNS = [
+    re.compile(keyword, re.IGNORECASE)
+    for keyword in ("about", "about this publication", "about the author")
+]
+
+
+def _find_subscriber_info(text):
+    """Return e.g. '1,200 subscribers' for the first matching pattern, or ''"""
+    for pattern, label in _SUBSCRIBER_PATTERNS:
+        match = pattern.search(text)
+        if match:
+            return f"{match.group(1)} {label}"
+    return ""
+
 
 def extract_author_profile_url(publication_url):
     """
@@ -52,10 +75,10 @@ def fetch_author_bio(author_profile_url, max_retries=2, timeout=None, rate_limit
     for attempt in range(max_retries):
         try:
             time.sleep(rate_limit_delay)
-            response = requests.get(author_profile_url, headers=Config.get_headers(), timeout=timeout)
+            response = get_session().get(author_profile_url, timeout=timeout)
             response.raise_for_status()
 
-            soup = BeautifulSoup(response.content, "html.parser")
+            soup = BeautifulSoup(response.content, HTML_PARSER)
 
             # Try to extract author bio from various locations
             bio_text = ""
@@ -168,10 +191,10 @@ def extract_metadata(
     for attempt in range(max_retries):
         try:
             time.sleep(rate_limit_delay)
-            response = requests.get(url, headers=Config.get_headers(), timeout=timeout)
+            response = get_session().get(url, timeout=timeout)
             response.raise_for_status()
 
-            soup = BeautifulSoup(response.content, "html.parser")
+            soup = BeautifulSoup(response.content, HTML_PARSER)
 
             # Extract meta description
             meta_desc = soup.find("meta", attrs={"name": "description"})
@@ -183,26 +206,9 @@ def extract_metadata(
                 if og_desc and og_desc.get("content"):
                     metadata["description"] = og_desc["content"].strip()
 
-            # Extract subscriber information
-            subscriber_patterns = [
-                (r"(\d+[,\d]*)\s+subscribers?", "subscribers"),
-                (r"(\d+[,\d]*)\s+readers?", "readers"),
-                (r"(\d+[KkMm])\s+subscribers?", "subscribers"),
-            ]
-
-            page_text = soup.get_text()
-            for pattern, label in subscriber_patterns:
-                match = re.search(pattern, page_text, re.IGNORECASE)
-                if match:
-                    metadata["subscriber_info"] = f"{match.group(1)} {label}"
-                    break
-
             # Extract about section
-            about_keywords = ["about", "about this publication", "about the author"]
-            for keyword in about_keywords:
-                heading = soup.find(
-                    ["h1", "h2", "h3", "h4"], string=re.compile(keyword, re.IGNORECASE)
-                )
+            for about_pattern in _ABOUT_HEADING_PATTERNS:
+                heading = soup.find(["h1", "h2", "h3", "h4"], string=about_pattern)
                 if heading:
                     about_text = []
                     for sibling in heading.find_next_siblings(["p", "div"]):
@@ -215,15 +221,23 @@ def extract_metadata(
                         metadata["about_text"] = " ".join(about_text)[:1500]
                         break
 
+            # Extract subscriber information. The description and about text
+            # usually carry the count, so only build the full page text
+            # (a copy of the whole document) when they don't.
+            metadata["subscriber_info"] = _find_subscriber_info(
+                f"{metadata['description']} {metadata['about_text']}"
+            ) or _find_subscriber_info(soup.get_text())
+
             # Extract content text for keyword analysis
-            content_text = ""
+            # Collect chunks and join once instead of repeated string +=
+            content_parts = []
             title = soup.find("title")
             if title:
-                content_text += f" {title.get_text()} "
+                content_parts.append(title.get_text())
             if metadata["description"]:
-                content_text += f" {metadata['description']} "
+                content_parts.append(metadata["description"])
             if metadata["about_text"]:
-                content_text += f" {metadata['about_text']} "
+                content_parts.append(metadata["about_text"])
 
             # For Substack pages, aggressively extract ALL visible text
             # since keywords often appear in post previews, tags, etc.
@@ -233,7 +247,7 @@ def extract_metadata(
                     tag.decompose()
                 # Get all visible text from the page
                 body_text = soup.get_text(strip=True, separator=" ")
-                content_text += f" {body_text[:5000]} "  # Get first 5000 chars
+                content_parts.append(body_text[:5000])  # Get first 5000 chars
                 logger.debug(f"Extracted {len(body_text)} chars from Substack page")
             else:
                 # For non-Substack pages, use selective extraction
@@ -249,16 +263,16 @@ def extract_metadata(
                     elements = soup.select(selector)
                     for elem in elements[:5]:
                         text = elem.get_text(strip=True, separator=" ")
-                        content_text += f" {text[:1000]} "
+                        content_parts.append(text[:1000])
                         break
 
-                if len(content_text.strip()) < 100:
+                if len(" ".join(content_parts).strip()) < 100:
                     for script in soup(["script", "style", "nav", "footer", "header"]):
                         script.decompose()
                     body_text = soup.get_text(strip=True, separator=" ")
-                    content_text += f" {body_text[:3000]} "
+                    content_parts.append(body_text[:3000])
 
-            metadata["content_text"] = content_text.lower()
+            metadata["content_text"] = " ".join(content_parts).lower()
 
             # Save to cache
             if use_cache:
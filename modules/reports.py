@@ -2,7 +2,9 @@
 Data quality reporting module.
 """
 
-from .validation import validate_publication_data
+from collections import Counter
+
+from .validation import validate_publication_data, scan_icon_files
 
 
 def generate_data_quality_report(publications):
@@ -16,34 +18,48 @@ def generate_data_quality_report(publications):
         "payment_breakdown": {"paid": 0, "free": 0, "unknown": 0},
     }
 
-    all_fields = set()
-    for pub in publications:
-        all_fields.update(pub.keys())
+    # Single pass: field presence, validation and payment status together
+    present_counts = Counter()
+    validation_summary = report["validation_summary"]
+    payment_breakdown = report["payment_breakdown"]
 
-    for field in all_fields:
-        present_count = sum(1 for pub in publications if pub.get(field))
-        report["complete_fields"][field] = present_count
-        report["missing_fields"][field] = len(publications) - present_count
-        report["field_coverage"][field] = (
-            (present_count / len(publications) * 100) if publications else 0
-        )
+    # List the icon folders once instead of one stat() per publication
+    existing_icons = scan_icon_files(pub.get("icon") for pub in publications)
 
     for pub in publications:
-        is_valid, errors, warnings = validate_publication_data(pub)
+        for field, value in pub.items():
+            # += False still records the field, so empty fields count as missing
+            present_counts[field] += bool(value)
+
+        is_valid, errors, warnings = validate_publication_data(
+            pub, existing_icons=existing_icons
+        )
         if is_valid:
-            report["validation_summary"]["valid"] += 1
+            validation_summary["valid"] += 1
         if errors:
-            report["validation_summary"]["errors"] += 1
+            validation_summary["errors"] += 1
         if warnings:
-            report["validation_summary"]["warnings"] += 1
+            validation_summary["warnings"] += 1
 
         if "is_paid" in pub:
             if pub["is_paid"]:
-                report["payment_breakdown"]["paid"] += 1
+                payment_breakdown["paid"] += 1
             else:
-                report["payment_breakdown"]["free"] += 1
+                payment_breakdown["free"] += 1
         else:
-            report["payment_breakdown"]["unknown"] += 1
+            payment_breakdown["unknown"] += 1
+
+    total = len(publications)
+    for field, present_count in present_counts.items():
+        report["complete_fields"][field] = present_count
+        report["missing_fields"][field] = total - present_count
+        report["field_coverage"][field] = present_count / total * 100
+
+    # Percentages are computed once here so printing needs no float math
+    report["payment_percent"] = {
+        status: (count / total * 100 if total else 0.0)
+        for status, count in payment_breakdown.items()
+    }
 
     return report
 
@@ -60,11 +76,12 @@ def print_data_quality_report(report):
     paid = report["payment_breakdown"]["paid"]
     free = report["payment_breakdown"]["free"]
     unknown = report["payment_breakdown"]["unknown"]
+    percent = report["payment_percent"]
     total = report["total_publications"]
-    print(f"  Paid:    {paid:3d} ({paid/total*100:.1f}%)")
-    print(f"  Free:    {free:3d} ({free/total*100:.1f}%)")
+    print(f"  Paid:    {paid:3d} ({percent['paid']:.1f}%)")
+    print(f"  Free:    {free:3d} ({percent['free']:.1f}%)")
     if unknown > 0:
-        print(f"  Unknown: {unknown:3d} ({unknown/total*100:.1f}%)")
+        print(f"  Unknown: {unknown:3d} ({percent['unknown']:.1f}%)")
 
     print("\n--- Field Coverage ---")
     key_fields = [
@@ -5,18 +5,32 @@ Core scraping module for extracting publication data from Substack.
 import os
 import re
 import requests
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, NavigableString, SoupStrainer
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 from urllib.parse import urlparse
 
 from .validation import validate_publication_data
-from .downloads import sanitize_filename, download_images_parallel
+from .downloads import sanitize_filename, download_image, download_images_parallel
 from .metadata import extract_metadata
+from .cache import preload_cache
 from .logger import get_logger, ProgressBar
-from .config import Config
+from .config import Config, HTML_PARSER
+from .http_cache import fetch_page
+
+# selectolax is optional: its C HTML parser and CSS engine extract the
+# publication rows much faster than BeautifulSoup's Python tree walks
+try:
+    from selectolax.lexbor import LexborHTMLParser as HTMLParser
+except ImportError:
+    HTMLParser = None
 
 logger = get_logger(__name__)
 
+# Class patterns for the reads page markup, compiled once
+_RE_READSROW = re.compile(r"readsRow-\w+")
+_RE_PROFILE_URL = re.compile(r"https://substack\.com/@([^/]+)")
+
 
 def normalize_substack_url(url):
     """
@@ -29,8 +43,7 @@ def normalize_substack_url(url):
         return url
 
     # Check if this is a profile URL pattern
-    profile_pattern = r'https://substack\.com/@([^/]+)'
-    match = re.match(profile_pattern, url)
+    match = _RE_PROFILE_URL.match(url)
 
     if match:
         username = match.group(1)
@@ -76,6 +89,106 @@ def extract_rss_url(publication_link):
     return f"{base_url}/feed"
 
 
+def _parse_reads_rows_selectolax(content, with_icons=True):
+    """Extract publication rows from a reads page with selectolax"""
+    rows = []
+    for link in HTMLParser(content).css('a[class*="readsRow-"]'):
+        name_elem = link.css_first('div[class*="weight-semibold-"]')
+        author_elem = link.css_first('div[class*="weight-regular-"]')
+        icon_elem = link.css_first("img") if with_icons else None
+        image_container = link.css_first(
+            'div[class*="pc-display-flex pc-position-relative"]'
+        )
+        is_paid = False
+        if image_container:
+            is_paid = image_container.css_first('svg[class*="badge-"]') is not None
+        rows.append(
+            (
+                link.attributes.get("href"),
+                name_elem.text(strip=True) if name_elem else None,
+                author_elem.text(strip=True) if author_elem else None,
+                icon_elem.attributes.get("src") if icon_elem else None,
+                is_paid,
+            )
+        )
+    return rows
+
+
+def _bs4_text(elem):
+    """Return elem.get_text(strip=True), reading a lone text node directly"""
+    # Name and author divs normally hold a single string; .string finds it
+    # without get_text()'s descendant walk (exact type: not a Comment)
+    string = elem.string
+    if type(string) is NavigableString:
+        return string.strip()
+    return elem.get_text(strip=True)
+
+
+def _parse_reads_rows_bs4(content, with_icons=True):
+    """Extract publication rows from a reads page with BeautifulSoup"""
+    # Only build the tree for publication rows; the rest of the page
+    # (navigation, scripts, footer) is never traversed
+    soup = BeautifulSoup(
+        content, HTML_PARSER, parse_only=SoupStrainer("a", class_=_RE_READSROW)
+    )
+    rows = []
+    # Attribute substring selectors instead of per-element regex class
+    # matches, mirroring the selectolax path
+    for link in soup.select('a[class*="readsRow-"]'):
+        name_elem = link.select_one('div[class*="weight-semibold-"]')
+        author_elem = link.select_one('div[class*="weight-regular-"]')
+        icon_elem = link.find("img") if with_icons else None
+        image_container = link.select_one(
+            'div[class*="pc-display-flex pc-position-relative"]'
+        )
+        is_paid = False
+        if image_container:
+            is_paid = image_container.select_one('svg[class*="badge-"]') is not None
+        rows.append(
+            (
+                link.get("href"),
+                _bs4_text(name_elem) if name_elem else None,
+                _bs4_text(author_elem) if author_elem else None,
+                icon_elem.get("src") if icon_elem else None,
+                is_paid,
+            )
+        )
+    return rows
+
+
+def parse_reads_rows(content, with_icons=True):
+    """
+    Extract the raw fields of every publication row on a reads page.
+
+    Uses selectolax when installed, otherwise BeautifulSoup. Returns a list
+    of (href, name, author_text, icon_src, is_paid) tuples; missing fields
+    are None. Pass with_icons=False to skip the icon lookup (icon_src is
+    then always None) when images will not be downloaded.
+    """
+    if HTMLParser is not None:
+        return _parse_reads_rows_selectolax(content, with_icons)
+    return _parse_reads_rows_bs4(content, with_icons)
+
+
+def _fetch_metadata_parallel(links, max_workers):
+    """
+    Fetch rich metadata for many publication links concurrently.
+
+    Each fetch is a rate-limited network round-trip, so running them on a
+    thread pool overlaps the waits. Returns a dict mapping link to metadata.
+    """
+    unique_links = list(dict.fromkeys(links))
+    metadata_by_link = {}
+    progress = ProgressBar(len(unique_links), "Fetching metadata")
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = {executor.submit(extract_metadata, link): link for link in unique_links}
+        for future in as_completed(futures):
+            link = futures[future]
+            metadata_by_link[link] = future.result()
+            progress.update(1, link.split("//", 1)[-1][:30])
+    return metadata_by_link
+
+
 def scrape_substack_reads(
     url,
     download_images=True,
@@ -91,6 +204,8 @@ def scrape_substack_reads(
     # Use Config defaults if not provided
     if images_folder is None:
         images_folder = Config.images_folder
+    # Resolve once so every image path built from it is already absolute
+    images_folder = os.path.abspath(images_folder)
     if max_workers is None:
         max_workers = Config.max_workers
 
@@ -98,44 +213,51 @@ def scrape_substack_reads(
         Path(images_folder).mkdir(parents=True, exist_ok=True)
 
     try:
-        response = requests.get(url, headers=Config.get_headers())
-        response.raise_for_status()
+        # Unchanged pages are answered with 304 and served from the cache
+        content = fetch_page(url, timeout=Config.timeout)
 
-        soup = BeautifulSoup(response.content, "html.parser")
+        pub_rows = parse_reads_rows(content, with_icons=download_images)
 
         publications = []
-        skipped_count = 0
+        # Parallel lists: accepted publications with an icon to fetch, and
+        # the (url, folder, filename) download task for each
+        image_pubs = []
         image_tasks = []
+        skipped_count = 0
+        duplicate_count = 0
+        # Links already accepted, for O(1) duplicate checks during the pass
+        seen_links = set()
 
-        pub_links = soup.find_all("a", class_=re.compile(r"readsRow-\w+"))
-        logger.info(f"Found {len(pub_links)} potential publications to scrape")
+        logger.info(f"Found {len(pub_rows)} potential publications to scrape")
+
+        # Load cached metadata once instead of one disk lookup per publication
+        if extract_rich_metadata:
+            preload_cache()
 
         # Progress bar for extraction
-        progress = ProgressBar(len(pub_links), "Extracting")
+        progress = ProgressBar(len(pub_rows), "Extracting")
 
         # First pass: Extract all data
-        for i, link in enumerate(pub_links, 1):
+        for href, name, author_text, og_icon, is_paid in pub_rows:
             pub_data = {}
 
-            if link.get("href"):
-                pub_data["link"] = normalize_substack_url(link["href"])
+            if href:
+                pub_data["link"] = normalize_substack_url(href)
 
-            name_elem = link.find("div", class_=re.compile(r"weight-semibold-\w+"))
-            if name_elem:
-                pub_data["name"] = name_elem.get_text(strip=True)
+            if name is not None:
+                pub_data["name"] = name
+            # Bound once for the checks and log lines below instead of
+            # repeated pub_data lookups
+            display_name = "Unknown" if name is None else name
 
-            author_elem = link.find("div", class_=re.compile(r"weight-regular-\w+"))
-            if author_elem:
-                author_text = author_elem.get_text(strip=True)
+            if author_text is not None:
                 # Remove "by " prefix if present
                 pub_data["author"] = author_text.replace("by ", "", 1).strip()
 
-            icon_elem = link.find("img")
-            if icon_elem and icon_elem.get("src"):
-                og_icon = icon_elem["src"]
-
-                if download_images and pub_data.get("name"):
-                    clean_name = sanitize_filename(pub_data["name"])
+            image_task = None
+            if og_icon:
+                if download_images and name:
+                    clean_name = sanitize_filename(name)
                     parsed_url = urlparse(og_icon)
                     url_filename = os.path.basename(parsed_url.path)
                     extension = (
@@ -145,101 +267,137 @@ def scrape_substack_reads(
                     )
                     filename = f"{clean_name}{extension}"
 
-                    pub_data["_image_task"] = (og_icon, images_folder, filename)
-                    image_tasks.append((og_icon, images_folder, filename))
+                    image_task = (og_icon, images_folder, filename)
 
-            image_container = link.find(
-                "div", class_=re.compile(r"pc-display-flex pc-position-relative")
-            )
-            is_paid = False
-            if image_container:
-                svg_badge = image_container.find("svg", class_=re.compile(r"badge-\w+"))
-                is_paid = svg_badge is not None
             pub_data["is_paid"] = is_paid
 
-            # Extract rich metadata if requested
-            if extract_rich_metadata and pub_data.get("link"):
-                logger.debug(
-                    f"Extracting metadata for {pub_data.get('name', 'Unknown')}..."
-                )
-                metadata = extract_metadata(pub_data["link"])
-                if metadata.get("description"):
-                    pub_data["description"] = metadata["description"]
-                if metadata.get("subscriber_info"):
-                    pub_data["subscriber_info"] = metadata["subscriber_info"]
-                if metadata.get("about_text"):
-                    pub_data["about_text"] = metadata["about_text"]
-
             # Validate data before adding
             if validate_data:
                 is_valid, errors, warnings = validate_publication_data(pub_data)
 
                 if not is_valid:
-                    logger.warning(
-                        f"Skipping invalid publication: {pub_data.get('name', 'Unknown')}"
-                    )
+                    logger.warning(f"Skipping invalid publication: {display_name}")
                     for error in errors:
                         logger.debug(f"  Validation error: {error}")
                     skipped_count += 1
-                    progress.update(
-                        1, f"Skipped: {pub_data.get('name', 'Unknown')[:30]}"
-                    )
+                    progress.update(1, f"Skipped: {display_name[:30]}")
                     continue
 
                 if warnings:
-                    logger.debug(
-                        f"Warnings for {pub_data.get('name', 'Unknown')}: {', '.join(warnings)}"
-                    )
-
-            if pub_data.get("name") and pub_data.get("link"):
+                    logger.debug(f"Warnings for {display_name}: {', '.join(warnings)}")
+
+            # Validation may have cleaned the link, so read it back
+            link = pub_data.get("link")
+            if name and link:
+                # Drop rows repeating an already-accepted publication link
+                if validate_data and link in seen_links:
+                    logger.debug(f"Skipping duplicate publication: {link}")
+                    duplicate_count += 1
+                    progress.update(1, f"Duplicate: {name[:30]}")
+                    continue
+                seen_links.add(link)
                 publications.append(pub_data)
-                progress.update(1, f"{pub_data.get('name', 'Unknown')[:30]}")
+                # Only accepted publications queue a download, so results
+                # line up with image_pubs by index
+                if image_task is not None:
+                    image_pubs.append(pub_data)
+                    image_tasks.append(image_task)
+                progress.update(1, f"{name[:30]}")
+        # Rows without a name or link are not counted, so the bar may stop
+        # short of its total
+        progress.finish()
+
+        download_in_parallel = parallel_downloads and len(image_tasks) > 1
+        parallel_images = download_images and image_tasks and download_in_parallel
+
+        # Image downloads overlap the metadata fetches below; both are
+        # network-bound and independent, so they split the worker budget to
+        # keep at most max_workers requests in flight
+        overlap = (
+            parallel_images
+            and extract_rich_metadata
+            and publications
+            and max_workers > 1
+        )
+        if overlap:
+            image_workers = max_workers // 2
+            metadata_workers = max_workers - image_workers
+        else:
+            image_workers = metadata_workers = max_workers
+
+        with ThreadPoolExecutor(max_workers=1) as background:
+            image_future = None
+            if overlap:
+                logger.info(
+                    f"Downloading {len(image_tasks)} images in parallel (max {image_workers} workers)..."
+                )
+                image_future = background.submit(
+                    download_images_parallel, image_tasks, image_workers
+                )
 
-        # Download images in parallel if enabled
-        if download_images and image_tasks:
-            if parallel_downloads and len(image_tasks) > 1:
+            # Extract rich metadata if requested, fetching all pages concurrently
+            if extract_rich_metadata and publications:
                 logger.info(
-                    f"Downloading {len(image_tasks)} images in parallel (max {max_workers} workers)..."
+                    f"Extracting metadata for {len(publications)} publications (max {metadata_workers} workers)..."
+                )
+                metadata_by_link = _fetch_metadata_parallel(
+                    [pub["link"] for pub in publications], metadata_workers
+                )
+                for pub in publications:
+                    metadata = metadata_by_link[pub["link"]]
+                    if metadata.get("description"):
+                        pub["description"] = metadata["description"]
+                    if metadata.get("subscriber_info"):
+                        pub["subscriber_info"] = metadata["subscriber_info"]
+                    if metadata.get("about_text"):
+                        pub["about_text"] = metadata["about_text"]
+
+            # Without overlap, parallel downloads start once metadata is done
+            if parallel_images and image_future is None:
+                logger.info(
+                    f"Downloading {len(image_tasks)} images in parallel (max {image_workers} workers)..."
+                )
+                image_future = background.submit(
+                    download_images_parallel, image_tasks, image_workers
                 )
-                image_results = download_images_parallel(image_tasks, max_workers)
+
+            if image_future is not None:
+                image_results = image_future.result()
 
                 cached_count = 0
                 downloaded_count = 0
-                for idx, pub in enumerate(publications):
-                    if "_image_task" in pub:
-                        if idx in image_results:
-                            file_path, was_cached = image_results[idx]
-                            if file_path:
-                                pub["icon"] = os.path.abspath(file_path)
-                                if was_cached:
-                                    cached_count += 1
-                                else:
-                                    downloaded_count += 1
-                        del pub["_image_task"]
+                for idx, pub in enumerate(image_pubs):
+                    if idx in image_results:
+                        file_path, was_cached = image_results[idx]
+                        if file_path:
+                            pub["icon"] = file_path
+                            if was_cached:
+                                cached_count += 1
+                            else:
+                                downloaded_count += 1
 
                 logger.info(
                     f"Images: {cached_count} cached, {downloaded_count} newly downloaded"
                 )
-            else:
-                from .downloads import download_image
-
-                logger.info(f"Downloading {len(image_tasks)} images sequentially...")
-                download_progress = ProgressBar(len(image_tasks), "Downloading images")
-                for idx, pub in enumerate(publications):
-                    if "_image_task" in pub:
-                        url, folder, filename = pub["_image_task"]
-                        file_path, was_cached = download_image(
-                            url, folder, filename, True
-                        )
-                        if file_path:
-                            pub["icon"] = os.path.abspath(file_path)
-                            status = "cached" if was_cached else "downloaded"
-                            download_progress.update(1, f"{status}: {pub['name'][:30]}")
-                        del pub["_image_task"]
+
+        # Sequential downloads when parallel mode is off (or only one image)
+        if download_images and image_tasks and not download_in_parallel:
+            logger.info(f"Downloading {len(image_tasks)} images sequentially...")
+            download_progress = ProgressBar(len(image_tasks), "Downloading images")
+            for pub, (url, folder, filename) in zip(image_pubs, image_tasks):
+                file_path, was_cached = download_image(url, folder, filename, True)
+                if file_path:
+                    pub["icon"] = file_path
+                    status = "cached" if was_cached else "downloaded"
+                    download_progress.update(1, f"{status}: {pub['name'][:30]}")
+            # Failed downloads are not counted; end the bar on the real count
+            download_progress.finish()
 
         logger.info(f"Successfully scraped {len(publications)} publications")
         if skipped_count > 0:
             logger.warning(f"Skipped {skipped_count} invalid publications")
+        if duplicate_count > 0:
+            logger.info(f"Skipped {duplicate_count} duplicate publications")
 
         return publications
 
@@ -0,0 +1,63 @@
+"""
+Shared HTTP session for all network requests.
+"""
+
+import threading
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from .config import Config
+
+# Transient server responses worth retrying (rate limiting, gateway errors)
+RETRY_STATUS_CODES = (429, 500, 502, 503, 504)
+
+_session = None
+_session_headers = None
+_session_lock = threading.Lock()
+
+
+def get_session():
+    """
+    Return the shared requests session, creating it on first use.
+
+    Reusing one pooled session keeps TCP/TLS connections alive across
+    requests to the same hosts (substack.com, publication pages, the image
+    CDN). It is created lazily so the pool is sized from Config.max_workers
+    after CLI arguments have been applied.
+
+    Transient status codes are retried here, backing off by
+    Config.rate_limit_delay. Connect and read failures are left to the
+    callers' own retry loops, so a dead or slow host is not retried in two
+    layers. After the last retry the response is returned as-is so callers
+    still see it via raise_for_status().
+
+    Config.get_headers() (User-Agent and cookie) are installed as the
+    session's default headers, so callers do not pass them per request.
+    """
+    global _session, _session_headers
+    with _session_lock:
+        if _session is None:
+            session = requests.Session()
+            adapter = HTTPAdapter(
+                pool_connections=Config.max_workers,
+                pool_maxsize=Config.max_workers * 4,
+                max_retries=Retry(
+                    total=Config.max_retries,
+                    connect=0,
+                    read=0,
+                    backoff_factor=Config.rate_limit_delay,
+                    status_forcelist=RETRY_STATUS_CODES,
+                    raise_on_status=False,
+                ),
+            )
+            session.mount("http://", adapter)
+            session.mount("https://", adapter)
+            _session = session
+
+        # get_headers() returns the same dict until the cookie changes, so
+        # an identity check is enough to keep the defaults current
+        headers = Config.get_headers()
+        if headers is not _session_headers:
+            _session.headers.update(headers)
+            _session_headers = headers
+        return _session
@@ -6,6 +6,29 @@ import os
 from urllib.parse import urlparse
 from difflib import SequenceMatcher
 
+# rapidfuzz is optional: its C++ ratio() is much faster than SequenceMatcher
+# for the short publication names compared in duplicate detection
+try:
+    from rapidfuzz.fuzz import ratio as _rapidfuzz_ratio
+except ImportError:
+    _rapidfuzz_ratio = None
+
+# With numpy installed as well, rapidfuzz's cdist() scores all name pairs
+# in one multithreaded C++ call instead of one Python call per pair
+try:
+    import numpy as np
+    from rapidfuzz.process import cdist as _rapidfuzz_cdist
+except ImportError:
+    np = None
+    _rapidfuzz_cdist = None
+
+# Rows of the score matrix computed per cdist() call, bounding its memory
+CDIST_BLOCK_ROWS = 1024
+
+_VALID_SCHEMES = frozenset({"http", "https"})
+# Characters that end or change the netloc urlparse() extracts from a host
+_SPECIAL_HOST_CHARS = frozenset("?#[]\t\r\n")
+
 
 def validate_url(url):
     """
@@ -22,6 +45,13 @@ def validate_url(url):
     if not url.startswith(("http://", "https://")):
         url = "https://" + url
 
+    # Fast path for the plain links scraped from the reads page: an ASCII
+    # host with a dot and no characters urlparse() treats specially would
+    # pass every check below, so skip building the ParseResult
+    host = url[8 if url[4] == "s" else 7 :].split("/", 1)[0]
+    if "." in host and host.isascii() and not _SPECIAL_HOST_CHARS.intersection(host):
+        return True, url, None
+
     # Parse URL
     try:
         parsed = urlparse(url)
@@ -31,7 +61,7 @@ def validate_url(url):
             return False, url, "Invalid URL format"
 
         # Check for valid scheme
-        if parsed.scheme not in ["http", "https"]:
+        if parsed.scheme not in _VALID_SCHEMES:
             return False, url, f"Invalid scheme: {parsed.scheme}"
 
         # Basic domain validation
@@ -44,53 +74,149 @@ def validate_url(url):
         return False, url, f"URL parsing error: {str(e)}"
 
 
+def _normalize_name(name):
+    """
+    Normalize a name for comparison; None for a missing name.
+
+    A missing name never matches anything, while whitespace-only names
+    normalize to "" and match each other. Every duplicate detection path
+    uses this one rule, so optional packages only change speed.
+    """
+    return name.lower().strip() if name else None
+
+
 def calculate_similarity(str1, str2):
     """
     Calculate similarity ratio between two strings (0.0 to 1.0)
-    Uses SequenceMatcher for fuzzy matching
+    Uses rapidfuzz when installed, otherwise SequenceMatcher
     """
-    if not str1 or not str2:
+    s1 = _normalize_name(str1)
+    s2 = _normalize_name(str2)
+    if s1 is None or s2 is None:
         return 0.0
 
-    # Normalize strings for comparison
-    s1 = str1.lower().strip()
-    s2 = str2.lower().strip()
-
+    if _rapidfuzz_ratio is not None:
+        return _rapidfuzz_ratio(s1, s2) / 100.0
     return SequenceMatcher(None, s1, s2).ratio()
 
 
+def _add_similar_pairs(pairs, names, similarity_threshold):
+    """Record every pair of names at or above the threshold in pairs"""
+    # A pair of lengths la <= lb can score at most 2 * la / (la + lb), so
+    # with names sorted by length each inner scan stops at the first name
+    # too long to reach the threshold
+    normalized = [_normalize_name(name) for name in names]
+    name_lengths = [len(name) if name else 0 for name in normalized]
+    by_length = sorted(range(len(names)), key=name_lengths.__getitem__)
+    for pos, i in enumerate(by_length):
+        shorter = name_lengths[i]
+        for j in by_length[pos + 1 :]:
+            longer = name_lengths[j]
+            # Two names that normalize to "" (e.g. whitespace only) still
+            # score 1.0, so only a non-empty partner bounds an empty name at 0
+            upper_bound = 2 * shorter / (shorter + longer) if longer else 1.0
+            # Small tolerance: scorers can round the same ratio differently
+            if upper_bound < similarity_threshold - 1e-9:
+                break
+            pair = (i, j) if i < j else (j, i)
+            if pairs.get(pair) is not None:
+                continue
+            similarity = calculate_similarity(names[pair[0]], names[pair[1]])
+            if similarity >= similarity_threshold or pair in pairs:
+                pairs[pair] = similarity
+
+
+def _add_similar_pairs_cdist(pairs, names, similarity_threshold):
+    """Record every pair of names at or above the threshold using cdist()"""
+    # Same normalization and scorer as calculate_similarity()
+    normalized = [_normalize_name(name) for name in names]
+    comparable = [name if name is not None else "" for name in normalized]
+    # Cut off just below the threshold and apply the exact comparison
+    # below, so results match calculate_similarity() at the boundary
+    score_cutoff = max(similarity_threshold * 100 - 1e-6, 0)
+    for start in range(0, len(comparable), CDIST_BLOCK_ROWS):
+        scores = _rapidfuzz_cdist(
+            comparable[start : start + CDIST_BLOCK_ROWS],
+            comparable,
+            scorer=_rapidfuzz_ratio,
+            score_cutoff=score_cutoff,
+            dtype=np.float64,
+            workers=-1,
+        )
+        rows, cols = np.nonzero(scores)
+        for row, j in zip(rows.tolist(), cols.tolist()):
+            i = start + row
+            # Upper triangle only; missing names never count as similar
+            if j <= i or normalized[i] is None or normalized[j] is None:
+                continue
+            similarity = scores[row, j] / 100.0
+            if similarity >= similarity_threshold:
+                pairs[(i, j)] = float(similarity)
+
+
 def find_duplicates(publications, similarity_threshold=0.85):
     """
     Find potential duplicate publications based on name similarity
     Returns list of tuples: (index1, index2, similarity_score, pub1, pub2)
     """
-    duplicates = []
-
-    for i in range(len(publications)):
-        for j in range(i + 1, len(publications)):
-            pub1 = publications[i]
-            pub2 = publications[j]
-
-            # Compare names
-            name_similarity = calculate_similarity(
-                pub1.get("name", ""), pub2.get("name", "")
-            )
-
-            # Also compare URLs (exact match)
-            same_url = (
-                pub1.get("link") == pub2.get("link") and pub1.get("link") is not None
-            )
+    # (index1, index2) -> name similarity, or None until it is computed
+    pairs = {}
+
+    # Exact URL duplicates: group indices by link in one O(N) pass
+    indices_by_link = {}
+    for i, pub in enumerate(publications):
+        link = pub.get("link")
+        if link is not None:
+            indices_by_link.setdefault(link, []).append(i)
+    for indices in indices_by_link.values():
+        for pos, i in enumerate(indices):
+            for j in indices[pos + 1 :]:
+                pairs[(i, j)] = None
+
+    names = [pub.get("name", "") for pub in publications]
+    if (
+        _rapidfuzz_cdist is not None
+        and _rapidfuzz_ratio is not None
+        and 0 < similarity_threshold <= 1
+    ):
+        _add_similar_pairs_cdist(pairs, names, similarity_threshold)
+    else:
+        _add_similar_pairs(pairs, names, similarity_threshold)
 
-            if name_similarity >= similarity_threshold or same_url:
-                duplicates.append((i, j, name_similarity, pub1, pub2))
+    duplicates = []
+    for (i, j), name_similarity in sorted(pairs.items()):
+        if name_similarity is None:
+            name_similarity = calculate_similarity(names[i], names[j])
+        duplicates.append((i, j, name_similarity, publications[i], publications[j]))
 
     return duplicates
 
 
-def validate_publication_data(pub, strict=False):
+def scan_icon_files(icon_paths):
+    """
+    Return the set of paths present in the folders holding icon_paths.
+
+    Icons usually share one images folder, so this is one scandir() per
+    folder instead of one stat() per icon in validate_publication_data().
+    """
+    files = set()
+    for folder in {os.path.dirname(path) for path in icon_paths if path}:
+        try:
+            with os.scandir(folder) as entries:
+                files.update(entry.path for entry in entries)
+        except OSError:
+            # Unreadable or missing folder: those icons fall back to stat()
+            pass
+    return files
+
+
+def validate_publication_data(pub, strict=False, existing_icons=None):
     """
     Validate a publication data dictionary
     Returns tuple: (is_valid, errors, warnings)
+
+    existing_icons is an optional set of paths known to exist (see
+    scan_icon_files()); icons found in it skip the os.path.exists() check.
     """
     errors = []
     warnings = []
@@ -123,7 +249,7 @@ def validate_publication_data(pub, strict=False):
         icon_path = pub["icon"]
         if not os.path.isabs(icon_path):
             warnings.append(f"Icon path is not absolute: {icon_path}")
-        elif not os.path.exists(icon_path):
+        elif icon_path not in (existing_icons or ()) and not os.path.exists(icon_path):
             warnings.append(f"Icon file does not exist: {icon_path}")
 
     # Check for suspicious data
@@ -10,6 +10,7 @@ import argparse
 # Import all modules
 from modules.config import Config
 from modules.cache import clear_cache
+from modules.http_cache import http_cache_dir
 from modules.scraper import scrape_substack_reads, extract_rss_url
 from modules.ai_labeling import categorize_with_claude
 from modules.labeling import filter_labels
@@ -48,8 +49,8 @@ Examples:
   # Custom output folders
   python substack_reads.py --images-folder ./icons --exports-folder ./data
 
-  # Conservative mode (slow, safe for rate limiting)
-  python substack_reads.py --workers 2 --delay 2.0 --no-parallel
+  # Conservative mode (slow, safe for rate limiting; one request at a time)
+  python substack_reads.py --workers 1 --delay 2.0 --no-parallel
 
   # Include RSS feed URLs in exports
   python substack_reads.py --rss --detailed
@@ -66,7 +67,7 @@ Examples:
     )
 
     # Input/Output
-    parser.add_argument('--url', type=str, default=Config.get_substack_url(),
+    parser.add_argument('--url', type=str, default=None,
                         help='Substack reads URL to scrape (default: from .env SUBSTACK_USER)')
     parser.add_argument('--images-folder', type=str, default=None,
                         help='Folder to save downloaded images (default: ~/projects/sandbox/exports/images)')
@@ -95,9 +96,9 @@ Examples:
     parser.add_argument('--no-parallel', action='store_true',
                         help='Disable parallel image downloads')
     parser.add_argument('--workers', type=int, default=5,
-                        help='Number of concurrent download threads (default: 5)')
+                        help='Number of concurrent threads for image downloads and metadata, author bio and AI requests (default: 5)')
     parser.add_argument('--no-cache', action='store_true',
-                        help='Disable content analysis caching')
+                        help='Disable content analysis and reads page caching')
     parser.add_argument('--no-skip-labeled', action='store_true',
                         help='Always analyze content even if already labeled')
 
@@ -107,7 +108,7 @@ Examples:
     parser.add_argument('--retries', type=int, default=2,
                         help='Number of retry attempts (default: 2)')
     parser.add_argument('--delay', type=float, default=1.0,
-                        help='Rate limit delay between requests in seconds (default: 1.0)')
+                        help='Rate limit delay between requests in seconds, applied per worker (default: 1.0)')
 
     # Label filtering
     parser.add_argument('--include-labels', type=str,
@@ -153,8 +154,12 @@ def main():
     # Handle cache clearing
     if args.clear_cache:
         clear_cache()
+        clear_cache(http_cache_dir())
         return 0
 
+    # Resolve the default URL only when --url was not given
+    url = args.url or Config.get_substack_url()
+
     # Update global config from args
     Config.timeout = args.timeout
     Config.max_retries = args.retries
@@ -189,7 +194,7 @@ def main():
         logger.info("SUBSTACK READS SCRAPER - Enhanced Edition")
         logger.info("="*60)
         logger.info(f"Configuration:")
-        logger.info(f"  URL: {args.url}")
+        logger.info(f"  URL: {url}")
         logger.info(f"  Parallel downloads: {Config.parallel_downloads} (workers: {Config.max_workers})")
         logger.info(f"  Content caching: {Config.use_cache}")
         logger.info(f"  Timeout: {Config.timeout}s, Retries: {Config.max_retries}, Delay: {Config.rate_limit_delay}s")
@@ -204,7 +209,7 @@ def main():
 
     # Run scraper
     publications = scrape_substack_reads(
-        args.url,
+        url,
         download_images=Config.download_images,
         images_folder=Config.images_folder,
         extract_rich_metadata=Config.extract_metadata,